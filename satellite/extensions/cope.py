@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from typing import Union, Optional
+from pathlib import Path
+import tempfile
+import csv
+import io
 
 import pandas as pd
 import numpy as np
@@ -12,6 +17,10 @@ from satellite.geo.models import ADM, ADMBase
 
 xr.set_options(keep_attrs=True)
 
+# Below this amount of ADMs per process, spawning the workers costs more than
+# the aggregation itself
+_MIN_ADMS_PER_WORKER = 50
+
 
 class CopeExtensionBase(ABC):
     """
@@ -47,7 +56,9 @@ class CopeExtensionBase(ABC):
     """
 
     @abstractmethod
-    def to_dataframe(self, adms: Union[list[ADM], ADM]) -> pd.DataFrame:
+    def to_dataframe(
+        self, adms: Union[list[ADM], ADM], workers: int = 1
+    ) -> pd.DataFrame:
         pass
 
     @abstractmethod
@@ -69,13 +80,48 @@ class CopeExtensionBase(ABC):
 class CopeExtension(CopeExtensionBase):
     def __init__(self, xarray_ds: xr.Dataset):
         self._ds = xarray_ds
+        self._converted_ds = None
+
+    @property
+    def _br_units_ds(self) -> xr.Dataset:
+        # xarray caches the accessor per dataset, so the unit conversion and
+        # the data loading are made only once instead of once per ADM
+        if self._converted_ds is None:
+            self._converted_ds = _convert_units(self._ds).load()
+        return self._converted_ds
+
+    def to_dataframe(
+        self, adms: Union[list[ADM], ADM], workers: int = 1
+    ) -> pd.DataFrame:
+        """
+        The ADMs are aggregated independently, so large lists can be split
+        into chunks and processed in parallel with `workers > 1`. By default
+        it runs in the current process.
 
-    def to_dataframe(self, adms: Union[list[ADM], ADM]) -> pd.DataFrame:
+        The weather columns are returned as float32, which holds the 4
+        rounded decimal places with half of the memory. `to_sql` keeps
+        inserting float64, so the stored values stay rounded.
+        """
         adms = [adms] if isinstance(adms, ADMBase) else adms
-        dfs = []
-        for adm in adms:
-            dfs.append(_adm_to_dataframe(self._ds, adm=adm))
-        return pd.concat(dfs, ignore_index=True)
+        workers = min(workers, len(adms) // _MIN_ADMS_PER_WORKER)
+        if workers <= 1:
+            df = _adm_to_dataframe(self._br_units_ds, adm=adms)
+        else:
+            df = self._parallel_to_dataframe(adms, workers)
+        floats = df.select_dtypes("float64").columns
+        df[floats] = df[floats].astype("float32")
+        return df
+
+    def _parallel_to_dataframe(self, adms: list[ADM], workers: int) -> pd.DataFrame:
+        chunks = [list(c) for c in np.array_split(adms, workers)]
+        # The workers receive a path to the converted dataset instead of the
+        # pickled dataset itself, so it is serialized only once
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = str(Path(tmpdir) / "dataset.nc")
+            self._br_units_ds.to_netcdf(fpath, engine="h5netcdf")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                dfs = executor.map(_netcdf_adm_to_dataframe, [fpath] * workers, chunks)
+                return pd.concat(list(dfs), ignore_index=True, copy=False)
 
     def to_sql(
         self,
@@ -89,7 +135,7 @@ class CopeExtension(CopeExtensionBase):
         adms = [adms] if isinstance(adms, ADMBase) else adms
         for adm in adms:
             _geocode_to_sql(
-                dataset=self._ds,
+                dataset=self._br_units_ds,
                 adm=adm,
                 con=con,
                 schema=schema,
@@ -102,7 +148,7 @@ class CopeExtension(CopeExtensionBase):
                 )
 
     def adm_ds(self, adm: ADM):
-        return _adm_ds(ds=self._ds, adm=adm)
+        return _adm_ds(ds=self._br_units_ds, adm=adm)
 
 
 def _geocode_to_sql(
@@ -119,54 +165,102 @@ def _geocode_to_sql(
         con=con,
         if_exists="append",
         index=False,
+        method=_insert_copy if _is_psycopg2(con) else None,
     )
     del df
 
 
-def _adm_to_dataframe(dataset: xr.Dataset, adm: ADM) -> pd.DataFrame:
+def _is_psycopg2(con) -> bool:
+    # `_insert_copy` relies on psycopg2's `copy_expert`, other PostgreSQL
+    # drivers (psycopg 3, pg8000, asyncpg) keep the default INSERTs
+    dialect = getattr(con, "dialect", None)
+    if dialect is not None:
+        return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+    if isinstance(con, str):
+        # psycopg2 is sqlalchemy's default driver for `postgresql://`
+        return con.split(":", 1)[0] in ("postgresql", "postgresql+psycopg2")
+    return False
+
+
+def _insert_copy(table, conn, keys, data_iter) -> None:
+    """
+    `pd.DataFrame.to_sql` insertion method that streams the rows through
+    PostgreSQL's `COPY FROM STDIN` instead of one INSERT per row.
+    """
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cur:
+        buf = io.StringIO()
+        csv.writer(buf).writerows(data_iter)
+        buf.seek(0)
+
+        columns = ", ".join(f'"{k}"' for k in keys)
+        tablename = (
+            f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+        )
+        cur.copy_expert(f"COPY {tablename} ({columns}) FROM STDIN WITH CSV", buf)
+
+
+def _adm_to_dataframe(dataset: xr.Dataset, adm: Union[list[ADM], ADM]) -> pd.DataFrame:
     ds = _adm_ds(ds=dataset, adm=adm)
+    epiweek = str(Week.fromdate(pd.Timestamp(ds.time.values[0])))
     df = ds.to_dataframe().reset_index()
     del ds
     df = df.drop(columns=["poly_idx", "name"])
-    df = df.assign(epiweek=str(Week.fromdate(pd.to_datetime(df.time)[0])))
+    df = df.assign(epiweek=epiweek)
     columns_to_round = list(
         set(df.columns).difference(set(["time", "code", "epiweek"]))
     )
-    df[columns_to_round] = df[columns_to_round].apply(lambda x: np.round(x, 4))
+    df[columns_to_round] = df[columns_to_round].round(4)
     df = df.rename(columns={"time": "date", "code": "geocode"})
     return df
 
 
-def _adm_ds(ds: xr.Dataset, adm: ADM) -> xr.Dataset:
-    ds = _convert_units(ds)
-    weightmap = xa.pixel_overlaps(ds, adm.to_dataframe(), silent=True)
-    ds = xa.aggregate(ds, weightmap, silent=True).to_dataset().sortby("time")
-    gb = ds.resample(time="1D")
-    gmin, gmean, gmax, gtot = (
-        _reduce_by(gb, np.min, "min"),
-        _reduce_by(gb, np.mean, "med"),
-        _reduce_by(gb, np.max, "max"),
-        _reduce_by(gb, np.sum, "tot"),
-    )
-    coords = [ds.code, ds.name, gmin, gmean, gmax]
-    if "precip_tot" in gtot.data_vars:
-        coords.append(gtot.precip_tot)
-    return xr.combine_by_coords(coords, data_vars="all")
-
+def _netcdf_adm_to_dataframe(fpath: str, adms: list[ADM]) -> pd.DataFrame:
+    # the file is opened lazily and only the cells within the bounding box of
+    # the chunk, plus a margin of one cell, are loaded by the worker
+    gdf = type(adms[0]).concat_dataframes(adms).to_crs("EPSG:4326")
+    minx, miny, maxx, maxy = gdf.total_bounds
+    with xr.open_dataset(fpath, engine="h5netcdf") as ds:
+        lat = ds.latitude.values
+        lon = ds.longitude.values
+        lon = np.where(lon > 180, lon - 360, lon)
+        lat_pad = np.abs(np.diff(lat)).max(initial=0)
+        lon_pad = np.abs(np.diff(lon)).max(initial=0)
+        bbox = ds.isel(
+            latitude=(lat >= miny - lat_pad) & (lat <= maxy + lat_pad),
+            longitude=(lon >= minx - lon_pad) & (lon <= maxx + lon_pad),
+        )
+        return _adm_to_dataframe(dataset=bbox.load(), adm=adms)
 
-def _reduce_by(ds: xr.Dataset, func, prefix: str) -> xr.Dataset:
-    ds = ds.apply(func=func).drop_vars(
-        ["code", "name", "adm1", "adm0"], errors="ignore"
-    )
 
-    return ds.rename(
-        dict(
-            zip(
-                list(ds.data_vars),
-                list(map(lambda x: f"{x}_{prefix}", list(ds.data_vars))),
-            )
+def _adm_ds(ds: xr.Dataset, adm: Union[list[ADM], ADM]) -> xr.Dataset:
+    # expects a dataset already parsed by `_convert_units`. When a list of
+    # ADMs is given, the pixel overlaps of every polygon are computed against
+    # the grid in a single pass, instead of once per ADM
+    adms = [adm] if isinstance(adm, ADMBase) else adm
+    gdf = type(adms[0]).concat_dataframes(adms)
+    weightmap = xa.pixel_overlaps(ds, gdf, silent=True)
+    ds = xa.aggregate(ds, weightmap, silent=True).to_dataset().sortby("time")
+    weather = ds.drop_vars(["code", "name", "adm1", "adm0"], errors="ignore")
+    gb = weather.resample(time="1D")
+    reduced = [
+        ds.code,
+        ds.name,
+        _reduce_by(gb, "min", "min"),
+        _reduce_by(gb, "mean", "med"),
+        _reduce_by(gb, "max", "max"),
+    ]
+    if "precip" in weather.data_vars:
+        reduced.append(
+            _reduce_by(weather[["precip"]].resample(time="1D"), "sum", "tot")
         )
-    )
+    # the reductions share the same coords, no alignment is needed
+    return xr.merge(reduced, join="exact")
+
+
+def _reduce_by(gb, func: str, prefix: str) -> xr.Dataset:
+    ds = getattr(gb, func)()
+    return ds.rename({var: f"{var}_{prefix}" for var in ds.data_vars})
 
 
 def _convert_units(ds: xr.Dataset) -> xr.Dataset:
@@ -184,13 +278,15 @@ def _convert_units(ds: xr.Dataset) -> xr.Dataset:
         parsed_vars["t2m"] = "temp"
 
         if "d2m" in _vars:
-            _ds["d2m"] = _ds.d2m - 273.15
+            d2m = _ds.d2m.values - 273.15
+            t2m = _ds.t2m.values
 
-            e = 6.112 * np.exp(17.67 * _ds.d2m / (_ds.d2m + 243.5))
-            es = 6.112 * np.exp(17.67 * _ds.t2m / (_ds.t2m + 243.5))
-            rh = (e / es) * 100
+            # e / es with both vapour pressures (Magnus formula) in a single
+            # exponential, the 6.112 factors cancel each other
+            rh = np.exp(17.67 * (d2m / (d2m + 243.5) - t2m / (t2m + 243.5)))
+            rh *= 100
 
-            _ds["d2m"] = rh
+            _ds["d2m"] = (_ds.d2m.dims, rh)
             _ds["d2m"].attrs = {
                 "units": "pct",
                 "long_name": "Umidade Relativa do Ar",
@@ -1,5 +1,7 @@
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent.parent
 ADM_DB = BASE_DIR / "data/ADM.duckdb"
 GPKGS_DIR = BASE_DIR / "data/gpkgs/"
+CACHE_DIR = Path(os.getenv("SATELLITE_CACHE_DIR", Path.home() / ".cache" / "satellite"))
@@ -1,4 +1,10 @@
+from pathlib import Path
+import json
+import os
+
 import duckdb
+import pandas as pd
+import geopandas as gpd
 
 from satellite.geo.constants import ADM_DB
 
@@ -16,3 +22,51 @@ class SessionContextManager:
 
 def session(engine=ADM_DB) -> SessionContextManager:
     return SessionContextManager(engine)
+
+
+def write_geoparquet(gdf: gpd.GeoDataFrame, fpath: Path) -> None:
+    """
+    Writes a GeoParquet file (WKB geometry + `geo` metadata) through duckdb,
+    which doesn't require pyarrow. The file is written to a temporary path
+    and then moved, so a concurrent reader never sees a partial file.
+    """
+    df = pd.DataFrame(gdf.drop(columns=gdf.geometry.name))
+    df["geometry"] = gdf.geometry.to_wkb()
+    geo = {
+        "version": "1.0.0",
+        "primary_column": "geometry",
+        "columns": {
+            "geometry": {
+                "encoding": "WKB",
+                "geometry_types": [],
+                "crs": gdf.crs.to_json_dict() if gdf.crs else None,
+            }
+        },
+    }
+    tmp = fpath.with_suffix(f".{os.getpid()}.tmp")
+    with duckdb.connect() as conn:
+        conn.register("gdf", df)
+        conn.execute(
+            f"COPY gdf TO {_quote(tmp)} "
+            f"(FORMAT PARQUET, KV_METADATA {{geo: {_quote(json.dumps(geo))}}})"
+        )
+    tmp.replace(fpath)
+
+
+def read_geoparquet(fpath: Path) -> gpd.GeoDataFrame:
+    with duckdb.connect() as conn:
+        (geo,) = conn.execute(
+            "SELECT value FROM parquet_kv_metadata(?) WHERE key = 'geo'",
+            [str(fpath)],
+        ).fetchone()
+        df = conn.execute("SELECT * FROM read_parquet(?)", [str(fpath)]).df()
+    column = json.loads(geo)["columns"]["geometry"]
+    return gpd.GeoDataFrame(
+        df.drop(columns="geometry"),
+        geometry=gpd.GeoSeries.from_wkb(df["geometry"].map(bytes)),
+        crs=column["crs"],
+    )
+
+
+def _quote(value) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
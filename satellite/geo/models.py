@@ -34,6 +34,10 @@ class ADMBase(ABC):
     @abstractmethod
     def to_dataframe(self) -> gpd.GeoDataFrame: ...
 
+    @classmethod
+    def concat_dataframes(cls, adms: List[ADM]) -> gpd.GeoDataFrame:
+        return _concat_gdfs([adm.to_dataframe() for adm in adms])
+
     @classmethod
     def get(cls: Type[ADM], **params) -> Type[ADM]:
         with functional.session() as session:
@@ -83,14 +87,35 @@ class ADMBase(ABC):
     @lru_cache(maxsize=None)
     def _read_gpkg(locale) -> gpd.GeoDataFrame:
         if locale == "BRA":
-            chunks = constants.GPKGS_DIR / "BRA"
-            dfs = []
-            for chunk in chunks.glob("*.zip"):
-                dfs.append(gpd.read_file(str(chunk), encoding="utf-8"))
-            df = pd.concat(dfs, ignore_index=True)
+            chunks = sorted((constants.GPKGS_DIR / "BRA").glob("*.zip"))
         else:
-            gpkg = constants.GPKGS_DIR / f"{locale}.zip"
-            df = gpd.read_file(str(gpkg), encoding="utf-8")
+            chunks = [constants.GPKGS_DIR / f"{locale}.zip"]
+
+        # Reading the zipped geopackages dominates the ADM extraction time, so
+        # the parsed GeoDataFrame is also kept on disk as GeoParquet to be
+        # reused by other processes. The key changes whenever a source file
+        # is modified
+        mtime = max(chunk.stat().st_mtime_ns for chunk in chunks)
+        cached = constants.CACHE_DIR / f"gpkg_{locale}_{mtime}.parquet"
+        if cached.exists():
+            try:
+                return functional.read_geoparquet(cached)
+            except Exception:  # unreadable cache, parse the sources again
+                cached.unlink(missing_ok=True)
+
+        dfs = [gpd.read_file(str(chunk), encoding="utf-8") for chunk in chunks]
+        df = pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0]
+
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            functional.write_geoparquet(df, cached)
+            # only finished caches, other processes may be writing a .tmp
+            for suffix in ("parquet", "pkl"):
+                for outdated in cached.parent.glob(f"gpkg_{locale}_*.{suffix}"):
+                    if outdated != cached:
+                        outdated.unlink(missing_ok=True)
+        except (OSError, duckdb.Error):
+            pass
         return df
 
     @classmethod
@@ -215,6 +240,41 @@ class ADM2(ADMBase):
         res.loc[0, "adm1"] = adm1
         return res[self.__fields__ + ["geometry"]]
 
+    @classmethod
+    def concat_dataframes(cls, adms: List["ADM2"]) -> gpd.GeoDataFrame:
+        # Looks up every (adm1, adm2) pair at once in the geopackage instead
+        # of filtering the whole GeoDataFrame once per ADM2
+        if not all(isinstance(adm, ADM2) for adm in adms):
+            return super().concat_dataframes(adms)
+
+        codes = pd.DataFrame(
+            {
+                "code": [adm.code for adm in adms],
+                "name": [adm.name for adm in adms],
+                "adm0": [
+                    adm.adm0.code if isinstance(adm.adm0, ADM0) else adm.adm0
+                    for adm in adms
+                ],
+                "adm1": [
+                    adm.adm1.code if isinstance(adm.adm1, ADM1) else adm.adm1
+                    for adm in adms
+                ],
+            }
+        )
+
+        dfs = []
+        for adm0, group in codes.groupby("adm0", sort=False):
+            gdf = cls._read_gpkg(adm0).set_index(["adm1", "adm2"])
+            keys = pd.MultiIndex.from_arrays([group["adm1"], group["code"]])
+            geometry = gdf.geometry.reindex(keys)
+            if geometry.isna().any():
+                raise ValueError("expects only one row as output")
+            dfs.append(gpd.GeoDataFrame(group, geometry=geometry.values, crs=gdf.crs))
+
+        # the rows are grouped by country above, restores the input order
+        res = _concat_gdfs(dfs, ignore_index=False).sort_index()
+        return res.reset_index(drop=True)[cls.__fields__ + ["geometry"]]
+
     @classmethod
     def get(cls: Type[ADM], **params) -> Optional[ADM]:
         res = super().get(**params)
@@ -222,3 +282,13 @@ class ADM2(ADMBase):
             res.adm0 = ADM0.get(code=res.adm0)
             res.adm1 = ADM1.get(code=res.adm1, adm0=res.adm0.code)
         return res
+
+
+def _concat_gdfs(
+    gdfs: List[gpd.GeoDataFrame], ignore_index: bool = True
+) -> gpd.GeoDataFrame:
+    # each country geopackage has its own CRS (SIRGAS 2000 for BRA, WGS 84
+    # for ARG), pandas refuses to concat geometries with different CRSs
+    if len({gdf.crs for gdf in gdfs}) > 1:
+        gdfs = [gdf.to_crs("EPSG:4326") for gdf in gdfs]
+    return pd.concat(gdfs, ignore_index=ignore_index)
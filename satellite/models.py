@@ -2,10 +2,13 @@ from datetime import date, datetime, timedelta
 from typing import Dict, Literal, Optional
 from abc import ABC, abstractmethod
 from pathlib import Path
+import hashlib
 import zipfile
 import uuid
+import json
 import os
 import io
+import re
 
 from pydantic import BaseModel, Field, field_validator, ValidationInfo
 from requests.exceptions import RequestException
@@ -15,6 +18,11 @@ import xarray as xr
 
 load_dotenv()
 
+_TIME_RE = re.compile(r"(?:[01][0-9]|2[0-3]):00")
+
+# CDS API expects the area as [North, West, South, East]
+_BBOX_ORDER = ("N", "W", "S", "E")
+
 
 class Area:
     def __init__(self, locale: Optional[str] = None):
@@ -40,7 +48,7 @@ class Area:
     @property
     def bbox(self):
         c = self.areas[self.locale]
-        return [c["N"], c["W"], c["S"], c["E"]]
+        return [c[k] for k in _BBOX_ORDER]
 
     @classmethod
     def from_coords(
@@ -168,19 +176,22 @@ class ERA5LandSpecs(Specs):
     @field_validator("product_type")
     @classmethod
     def validate_product_type(cls, value: str) -> str:
-        assert value, "`product_type` must be a list of strings"
+        if not value:
+            raise ValueError("`product_type` must be a list of strings")
         return value
 
     @field_validator("variable")
     @classmethod
     def validate_variable(cls, value: list[str]) -> list[str]:
-        assert value, "`variable` must be a list of strings"
+        if not value:
+            raise ValueError("`variable` must be a list of strings")
         return value
 
     @field_validator("date")
     @classmethod
     def validate_date(cls, value: str) -> str:
-        assert isinstance(value, str), "`date` must be a string"
+        if not isinstance(value, str):
+            raise ValueError("`date` must be a string")
 
         if "/" in value:
             ini, end = value.split("/")
@@ -193,14 +204,11 @@ class ERA5LandSpecs(Specs):
     @field_validator("time")
     @classmethod
     def validate_time(cls, value: list[str]) -> list[str]:
-        assert value, "empty time list"
+        if not value:
+            raise ValueError("empty time list")
         for time in value:
-            assert ":" in time, "format: 'hh:00'. e.g '23:00'"
-            hour, mins = time.split(":")
-            assert mins == "00", "minutes must be 00. e.g '23:00'"
-            assert hour in [
-                f"{h:02d}" for h in range(24)
-            ], f"invalid hour {hour}. e.g '23:00'"
+            if not _TIME_RE.fullmatch(time):
+                raise ValueError(f"invalid time {time}. format: 'hh:00'. e.g '23:00'")
         return value
 
     @field_validator("area")
@@ -239,6 +247,23 @@ class ERA5LandRequest(BaseRequest):
     def download(self, output: str) -> str:
         request: ERA5LandSpecs = self.request
         output = Path(output)
+        specs = {
+            "product_type": request.product_type,
+            "variable": request.variable,
+            "date": request.date,
+            "time": request.time,
+            "area": request.area,
+            "format": request.format,
+            "download_format": request.download_format,
+        }
+
+        if output.is_dir():
+            # the file is named after the request specs, so an identical
+            # request is found on disk and never retrieved again
+            digest = hashlib.sha1(
+                json.dumps(specs, sort_keys=True).encode()
+            ).hexdigest()[:12]
+            output = output / f"{self.name}_{digest}"
 
         if request.download_format == "zip":
             output = output.with_suffix(".zip")
@@ -254,19 +279,7 @@ class ERA5LandRequest(BaseRequest):
         client = self.get_client(self.api_key)
 
         try:
-            client.retrieve(
-                self.name,
-                {
-                    "product_type": request.product_type,
-                    "variable": request.variable,
-                    "date": request.date,
-                    "time": request.time,
-                    "area": request.area,
-                    "format": request.format,
-                    "download_format": request.download_format,
-                },
-                str(output),
-            )
+            client.retrieve(self.name, specs, str(output))
         except (RequestException, KeyboardInterrupt) as e:
             output.unlink(missing_ok=True)
             raise e
@@ -285,4 +298,12 @@ class DataSet:
                 with zip_files.open(zfiles[0]) as zfile:
                     data = zfile.read()
                     return xr.open_dataset(io.BytesIO(data), engine="h5netcdf")
-        return xr.open_dataset(fpath, engine="netcdf4")
+
+        # h5netcdf reads local netCDF4 (HDF5) files without going through
+        # libnetcdf. netCDF3 files and remote (OPeNDAP) URLs are still read
+        # by the netcdf4 engine
+        is_hdf5 = False
+        if Path(fpath).is_file():
+            with open(fpath, "rb") as f:
+                is_hdf5 = f.read(8) == b"\x89HDF\r\n\x1a\n"
+        return xr.open_dataset(fpath, engine="h5netcdf" if is_hdf5 else "netcdf4")
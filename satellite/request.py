@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Literal
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -32,7 +33,14 @@ def reanalysis_era5_land(
     area: Optional[Dict[Literal["N", "S", "W", "E"], float]] = None,
     format: Literal["grib", "netcdf"] = "netcdf",
     download_format: Literal["zip", "unarchived"] = "zip",
+    max_workers: int = 4,
 ) -> xr.Dataset:
+    """
+    Date ranges spanning multiple months are split into monthly requests,
+    downloaded concurrently (up to `max_workers`, CDS queues at most a few
+    requests per user) into `<output>_<YYYYMM>` files and combined by coords.
+    When `output` is a directory, each monthly file is named after its request.
+    """
     request = dict(
         product_type=product_type,
         variable=variable,
@@ -45,6 +53,40 @@ def reanalysis_era5_land(
     )
     if output and Path(output).is_file():
         return DataSet.from_netcdf(output)
-    return DataSet.from_netcdf(
-        ERA5LandRequest(api_key=api_token, request=request).download(output)
-    )
+
+    dates = _split_by_month(date)
+    if len(dates) == 1:
+        return DataSet.from_netcdf(
+            ERA5LandRequest(api_key=api_token, request=request).download(output)
+        )
+
+    base = Path(output).with_suffix("")
+
+    def download(month: str) -> str:
+        part = output
+        if not Path(output).is_dir():
+            yyyymm = month[:7].replace("-", "")
+            part = str(base.with_name(f"{base.name}_{yyyymm}"))
+        return ERA5LandRequest(
+            api_key=api_token, request={**request, "date": month}
+        ).download(part)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(dates))) as pool:
+        files = list(pool.map(download, dates))
+
+    return xr.combine_by_coords([DataSet.from_netcdf(f) for f in files])
+
+
+def _split_by_month(date: str) -> list[str]:
+    if "/" not in date:
+        return [date]
+
+    ini, end = (datetime.fromisoformat(d).date() for d in date.split("/"))
+    if ini > end:
+        raise ValueError(f"start date {ini} is after end date {end} in '{date}'")
+    months = []
+    while ini <= end:
+        next_month = (ini.replace(day=1) + timedelta(days=32)).replace(day=1)
+        months.append(f"{ini}/{min(next_month - timedelta(days=1), end)}")
+        ini = next_month
+    return months
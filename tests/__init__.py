@@ -0,0 +1,9 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+# Keeps the geopackages cache written by the tests out of ~/.cache/satellite.
+# Must be set before `satellite.geo.constants` is imported
+os.environ["SATELLITE_CACHE_DIR"] = tempfile.mkdtemp(prefix="satellite-tests-")
+atexit.register(shutil.rmtree, os.environ["SATELLITE_CACHE_DIR"], True)
@@ -1,19 +1,32 @@
 import unittest
+import tempfile
 from cProfile import Profile
+from types import SimpleNamespace
+from unittest import mock
 from pathlib import Path
 from pstats import Stats
 
 import loguru
+import numpy as np
+import pandas as pd
 import xarray as xr
 from satellite import DataSet, ADM2, ADM0
+from satellite.extensions import cope
+from satellite.extensions.cope import (
+    _adm_to_dataframe,
+    _insert_copy,
+    _is_psycopg2,
+    _netcdf_adm_to_dataframe,
+)
 
 logger = loguru.logger
 
 
 class TestWeatherCopebr(unittest.TestCase):
-    def setUp(self) -> None:
-        self.file = Path(__file__).parent / "data" / "BR_20230101.nc"
-        self.dataset = DataSet.from_netcdf((str(self.file)))
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.file = Path(__file__).parent / "data" / "BR_20230101.nc"
+        cls.dataset = DataSet.from_netcdf((str(cls.file)))
 
     def test_get_latlons_from_geocode(self):
         profiler = Profile()
@@ -40,6 +53,143 @@ class TestWeatherCopebr(unittest.TestCase):
         logger.info("")
         stats.sort_stats("cumtime").print_stats(10)
 
-        self.assertTrue(type(dataset) == xr.core.dataset.Dataset)
-        self.assertEqual(list(dataset.keys()), ["t2m", "tp", "d2m", "msl"])
-        self.assertEqual(list(dataset.coords), ["longitude", "latitude", "time"])
+        cases = [
+            (type(dataset), xr.core.dataset.Dataset),
+            (list(dataset.keys()), ["t2m", "tp", "d2m", "msl"]),
+            (list(dataset.coords), ["longitude", "latitude", "time"]),
+        ]
+        for result, expected in cases:
+            with self.subTest(expected=expected):
+                self.assertEqual(result, expected)
+
+    def test_load_netcdf_remote_url(self):
+        url = "https://example.org/thredds/dodsC/era5_land.nc"
+        with mock.patch.object(xr, "open_dataset") as open_dataset:
+            DataSet.from_netcdf(url)
+
+        open_dataset.assert_called_once_with(url, engine="netcdf4")
+
+
+class TestCopeDataFrame(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # ERA5-Land `valid_time` format, packed as int16 with scale/offset
+        cls.file = Path(__file__).parent / "data" / "BR_20230101_packed.nc"
+        cls.dataset = DataSet.from_netcdf(str(cls.file))
+        cls.adms = [
+            ADM2.get(code=3304557, adm0="BRA"),
+            ADM2.get(code=3303302, adm0="BRA"),
+        ]
+
+    def test_dtypes(self):
+        weather = ["temp_med", "precip_tot", "umid_med", "pressao_med"]
+        df = self.dataset.cope.to_dataframe(self.adms, workers=1)
+        # `to_sql` inserts the float64 frame, keeping the rounded values
+        sql_df = _adm_to_dataframe(self.dataset.cope._br_units_ds, adm=self.adms)
+
+        for column in weather:
+            with self.subTest(column=column):
+                self.assertEqual(df[column].dtype, "float32")
+                self.assertEqual(sql_df[column].dtype, "float64")
+                self.assertTrue(sql_df[column].equals(sql_df[column].round(4)))
+
+    def test_workers(self):
+        serial = self.dataset.cope.to_dataframe(self.adms, workers=1)
+        with mock.patch.object(cope, "_MIN_ADMS_PER_WORKER", 1):
+            parallel = self.dataset.cope.to_dataframe(self.adms, workers=2)
+
+        pd.testing.assert_frame_equal(serial, parallel)
+        for column in ["umid_min", "umid_max"]:
+            with self.subTest(column=column):
+                self.assertTrue(parallel[column].between(0, 100).all())
+
+    def _grid(self) -> xr.Dataset:
+        # spans from Buenos Aires to Rio de Janeiro with a latitude gradient
+        grid = self.dataset.mean(["latitude", "longitude"])
+        grid = grid.expand_dims(
+            latitude=np.arange(-22.0, -36.0, -0.25),
+            longitude=np.arange(-59.0, -42.0, 0.25),
+        ).transpose("valid_time", "latitude", "longitude")
+        grid["t2m"] = grid.t2m + grid.latitude * 0.1
+        return grid
+
+    def test_worker_bbox(self):
+        grid = self._grid().cope._br_units_ds
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = str(Path(tmpdir) / "dataset.nc")
+            grid.to_netcdf(fpath, engine="h5netcdf")
+            with mock.patch.object(
+                cope, "_adm_to_dataframe", wraps=_adm_to_dataframe
+            ) as adm_to_dataframe:
+                df = _netcdf_adm_to_dataframe(fpath, self.adms)
+
+        loaded = adm_to_dataframe.call_args.kwargs["dataset"]
+        self.assertLess(loaded.latitude.size, grid.latitude.size)
+        self.assertLess(loaded.longitude.size, grid.longitude.size)
+        pd.testing.assert_frame_equal(df, _adm_to_dataframe(grid, adm=self.adms))
+
+    def test_mixed_countries(self):
+        # BRA geopackages are in SIRGAS 2000 and ARG's in WGS 84
+        grid = self._grid()
+        adms = [
+            self.adms[0],
+            ADM2.get(code="02001", adm0="ARG"),
+            self.adms[1],
+        ]
+
+        df = grid.cope.to_dataframe(adms, workers=1)
+        single = [grid.cope.to_dataframe(adm, workers=1) for adm in adms]
+
+        self.assertEqual(list(df.geocode), [str(adm.code) for adm in adms])
+        pd.testing.assert_frame_equal(df, pd.concat(single, ignore_index=True))
+
+
+class TestCopeToSQL(unittest.TestCase):
+    def test_is_psycopg2(self):
+        def engine(name, driver):
+            return SimpleNamespace(dialect=SimpleNamespace(name=name, driver=driver))
+
+        cases = [
+            ("postgresql://user@host/db", True),
+            ("postgresql+psycopg2://user@host/db", True),
+            ("postgresql+psycopg://user@host/db", False),
+            ("postgresql+pg8000://user@host/db", False),
+            ("postgresql+asyncpg://user@host/db", False),
+            ("duckdb:///satellite.duckdb", False),
+            (engine("postgresql", "psycopg2"), True),
+            (engine("postgresql", "psycopg"), False),
+            (engine("sqlite", "pysqlite"), False),
+            (None, False),
+        ]
+        for con, expected in cases:
+            with self.subTest(con=con):
+                self.assertEqual(_is_psycopg2(con), expected)
+
+    def test_insert_copy(self):
+        conn = mock.MagicMock()
+        cur = conn.connection.cursor.return_value.__enter__.return_value
+        copied = []
+        cur.copy_expert.side_effect = lambda sql, buf: copied.append((sql, buf.read()))
+
+        for schema, tablename in [
+            ("weather", '"weather"."copernicus"'),
+            (None, '"copernicus"'),
+        ]:
+            with self.subTest(schema=schema):
+                copied.clear()
+                _insert_copy(
+                    SimpleNamespace(schema=schema, name="copernicus"),
+                    conn,
+                    ["geocode", "temp_min"],
+                    iter([("3304557", 21.4435), ("3550308", 18.5)]),
+                )
+                self.assertEqual(
+                    copied,
+                    [
+                        (
+                            f'COPY {tablename} ("geocode", "temp_min") '
+                            "FROM STDIN WITH CSV",
+                            "3304557,21.4435\r\n3550308,18.5\r\n",
+                        )
+                    ],
+                )
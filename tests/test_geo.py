@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import geopandas as gpd
+from shapely.geometry import Point, box
+
+from satellite.geo import constants, functional
+from satellite.geo.models import ADMBase
+
+
+class TestGeoParquetCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmpdir.name)
+        self.gdf = gpd.GeoDataFrame(
+            {"adm1": ["33", "35"], "adm2": ["3304557", "3550308"]},
+            geometry=[box(-43.8, -23.1, -43.1, -22.7), Point(-46.6, -23.5)],
+            crs="EPSG:4674",
+        )
+
+    def tearDown(self) -> None:
+        ADMBase._read_gpkg.cache_clear()
+        self.tmpdir.cleanup()
+
+    def test_geoparquet_roundtrip(self):
+        fpath = self.cache_dir / "gdf.parquet"
+        functional.write_geoparquet(self.gdf, fpath)
+        res = functional.read_geoparquet(fpath)
+
+        self.assertEqual(res.crs, self.gdf.crs)
+        self.assertEqual(res["adm2"].tolist(), self.gdf["adm2"].tolist())
+        self.assertTrue(res.geometry.geom_equals_exact(self.gdf.geometry, 0).all())
+
+    def test_read_gpkg_cache(self):
+        gpkg = constants.GPKGS_DIR / "ARG.zip"
+        cached = self.cache_dir / f"gpkg_ARG_{gpkg.stat().st_mtime_ns}.parquet"
+        outdated = self.cache_dir / "gpkg_ARG_1.pkl"
+        outdated.write_bytes(b"outdated")
+        # a cache being written by another process
+        writing = self.cache_dir / "gpkg_ARG_2.1234.tmp"
+        writing.write_bytes(b"writing")
+        cached.write_bytes(b"not a parquet file")
+
+        with (
+            mock.patch.object(constants, "CACHE_DIR", self.cache_dir),
+            mock.patch.object(gpd, "read_file", return_value=self.gdf) as read_file,
+        ):
+            # an unreadable cache is parsed again and replaced
+            res = ADMBase._read_gpkg("ARG")
+            ADMBase._read_gpkg.cache_clear()
+            cached_res = ADMBase._read_gpkg("ARG")
+
+        read_file.assert_called_once()
+        self.assertEqual(sorted(self.cache_dir.iterdir()), sorted([cached, writing]))
+        self.assertEqual(res["adm2"].tolist(), cached_res["adm2"].tolist())
@@ -0,0 +1,132 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+import xarray as xr
+from pydantic import ValidationError
+
+from satellite.models import ERA5LandRequest, ERA5LandSpecs
+from satellite.request import _split_by_month, reanalysis_era5_land
+
+FIXTURE = Path(__file__).parent / "data" / "BR_20230101_packed.nc"
+
+
+class MockClient:
+    """
+    Writes the fixture shifted to the first requested day. The barrier only
+    releases when `parties` requests are being retrieved at the same time,
+    the files are then written one at a time (libnetcdf isn't thread-safe)
+    """
+
+    def __init__(self, parties: int):
+        self.barrier = threading.Barrier(parties, timeout=10)
+        self.lock = threading.Lock()
+        self.requests = []
+
+    def retrieve(self, name: str, request: dict, output: str) -> None:
+        self.requests.append((request["date"], output))
+        self.barrier.wait()
+        ini = pd.Timestamp(request["date"].split("/")[0])
+        with self.lock:
+            with xr.open_dataset(FIXTURE) as ds:
+                ds = ds.load()
+            ds["valid_time"] = ds.valid_time + (ini - pd.Timestamp("2023-01-01"))
+            ds.to_netcdf(output)
+
+
+class TestRequest(unittest.TestCase):
+    CASES = [
+        ("2023-01-01", ["2023-01-01"]),
+        ("2023-01-05/2023-01-20", ["2023-01-05/2023-01-20"]),
+        (
+            "2023-12-30/2024-03-02",
+            [
+                "2023-12-30/2023-12-31",
+                "2024-01-01/2024-01-31",
+                "2024-02-01/2024-02-29",
+                "2024-03-01/2024-03-02",
+            ],
+        ),
+    ]
+
+    def test_split_by_month(self):
+        for date, expected in self.CASES:
+            with self.subTest(date=date):
+                self.assertEqual(_split_by_month(date), expected)
+
+        with self.assertRaises(ValueError):
+            _split_by_month("2023-03-01/2023-01-01")
+
+    def test_validate_time(self):
+        self.assertEqual(
+            ERA5LandSpecs(time=["00:00", "09:00", "23:00"]).time,
+            ["00:00", "09:00", "23:00"],
+        )
+        for time in [[], ["24:00"], ["1:00"], ["10:30"], ["23:00\n"], ["1٢:00"]]:
+            with self.subTest(time=time):
+                with self.assertRaises(ValidationError):
+                    ERA5LandSpecs(time=time)
+
+    def test_validate_variables(self):
+        for field in ["product_type", "variable"]:
+            with self.subTest(field=field):
+                with self.assertRaises(ValidationError):
+                    ERA5LandSpecs(**{field: []})
+
+    def test_concurrent_monthly_download(self):
+        client = MockClient(parties=3)
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            mock.patch.object(ERA5LandRequest, "get_client", return_value=client),
+        ):
+            output = str(Path(tmpdir) / "BR")
+            ds = reanalysis_era5_land(
+                output,
+                date="2023-01-01/2023-03-02",
+                download_format="unarchived",
+            )
+            # the monthly files are reused by a repeated request
+            reanalysis_era5_land(
+                output,
+                date="2023-01-01/2023-03-02",
+                download_format="unarchived",
+            )
+
+            self.assertEqual(
+                sorted(client.requests),
+                [
+                    ("2023-01-01/2023-01-31", f"{output}_202301.nc"),
+                    ("2023-02-01/2023-02-28", f"{output}_202302.nc"),
+                    ("2023-03-01/2023-03-02", f"{output}_202303.nc"),
+                ],
+            )
+            self.assertEqual(len(ds.valid_time), 3 * 8)
+            self.assertEqual(
+                pd.DatetimeIndex(ds.valid_time.values).normalize().unique().tolist(),
+                [pd.Timestamp(d) for d in ["2023-01-01", "2023-02-01", "2023-03-01"]],
+            )
+            ds.close()
+
+    def test_concurrent_monthly_download_to_directory(self):
+        client = MockClient(parties=2)
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            mock.patch.object(ERA5LandRequest, "get_client", return_value=client),
+        ):
+            ds = reanalysis_era5_land(
+                tmpdir, date="2023-01-31/2023-02-01", download_format="unarchived"
+            )
+            ds.close()
+
+            # the parts are named after the request inside the directory
+            files = sorted(str(f) for f in Path(tmpdir).iterdir())
+            self.assertEqual(sorted(f for _, f in client.requests), files)
+            self.assertEqual(len(files), 2)
+            for f in files:
+                with self.subTest(file=f):
+                    self.assertRegex(
+                        Path(f).name, r"^reanalysis-era5-land_[0-9a-f]{12}\.nc$"
+                    )